@@ -0,0 +1,83 @@
+"""Short-lived response cache for informational (read-only) A2A prompts."""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+# Tools that only read TradingView state. Anything else (add_, remove_, set_,
+# create_, delete_, toggle_, zoom_, ...) is a command that changes it.
+_READ_ONLY_PREFIXES = ("get_", "list_")
+
+
+def is_read_only_tool(name: str) -> bool:
+    """Return True if an MCP tool name (bare or mcp__server__ prefixed) is read-only."""
+    return name.rsplit("__", 1)[-1].startswith(_READ_ONLY_PREFIXES)
+
+
+class ResponseCache:
+    """TTL + LRU cache of backend responses keyed by normalized prompt.
+
+    Only responses produced purely by read-only tools should be stored;
+    callers clear the cache whenever a command tool runs, since any cached
+    answer may then be stale. clear() bumps the generation, and put() drops
+    responses computed under an older one, so a query that was in flight
+    across a command can't store its pre-command answer.
+    """
+
+    def __init__(self, ttl: float = 60.0, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[bytes, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.maxsize > 0
+
+    @property
+    def generation(self) -> int:
+        """Read before computing a response and pass the value to put()."""
+        return self._generation
+
+    @staticmethod
+    def key(prompt: str, model: str | None = None) -> bytes:
+        """Hash the lowercased, whitespace-collapsed prompt with the model."""
+        normalized = " ".join(prompt.lower().split())
+        return hashlib.blake2b(
+            f"{model or ''}\0{normalized}".encode(), digest_size=16
+        ).digest()
+
+    def get(self, key: bytes) -> str | None:
+        """Return the cached response for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, text = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return text
+
+    def put(self, key: bytes, text: str, generation: int) -> None:
+        """Store a response, evicting the least recently used entry if full.
+
+        Dropped if the cache was cleared since generation was read.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, text)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
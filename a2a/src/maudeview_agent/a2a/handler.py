@@ -1,83 +1,225 @@
 """Task handler for A2A tasks — dispatches to Claude or LM Studio backend."""
 
+import asyncio
+import io
 import logging
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
 
 from claude_agent_sdk import (
     AssistantMessage,
     ClaudeSDKClient,
     TextBlock,
+    ToolResultBlock,
+    ToolUseBlock,
+    UserMessage,
 )
 
 from ..config import config
 from ..options import build_claude_options
-from .models import Message, Task, TaskState, TaskStatus, TextPart
+from .cache import ResponseCache, is_read_only_tool
+from .models import Message, Task, TaskStatus, TextPart
+
+if TYPE_CHECKING:
+    from ..lmstudio import LMStudioAgent
 
 logger = logging.getLogger(__name__)
 
+# Only tasks that have finished are eligible for eviction.
+_TERMINAL_STATES = frozenset({"completed", "failed", "canceled"})
+
 
 class TaskHandler:
     """Handles A2A tasks by delegating to Claude or LM Studio with MCP tools."""
 
-    def __init__(self):
-        self.tasks: dict[str, Task] = {}
+    def __init__(self, max_tasks: int = 10_000):
+        self.tasks: OrderedDict[str, Task] = OrderedDict()
+        self.max_tasks = max_tasks
+        # Guards tasks: an OrderedDict update (insert + move_to_end + evict)
+        # is several steps, and none of them awaits, so a thread lock fits.
+        self._tasks_lock = threading.Lock()
+        self._response_cache = ResponseCache(ttl=config.a2a_response_cache_ttl)
+        self._lmstudio_agent: "LMStudioAgent | None" = None
+        self._lmstudio_lock = asyncio.Lock()
+
+    def get_task(self, task_id: str) -> Task | None:
+        """Look up a stored task, marking it as recently used."""
+        with self._tasks_lock:
+            task = self.tasks.get(task_id)
+            if task is not None:
+                self.tasks.move_to_end(task_id)
+            return task
+
+    def get_or_create_task(self, task_id: str | None) -> Task:
+        """Return the stored task for task_id, or store a new submitted one."""
+        with self._tasks_lock:
+            task = self.tasks.get(task_id) if task_id else None
+            if task is None:
+                task = Task(status=TaskStatus(state="submitted"))
+                self._store(task)
+            else:
+                self.tasks.move_to_end(task.id)
+            return task
+
+    def store_task(self, task: Task) -> None:
+        """Store a task as most recently used, evicting old finished tasks."""
+        with self._tasks_lock:
+            self._store(task)
+
+    def _store(self, task: Task) -> None:
+        self.tasks[task.id] = task
+        self.tasks.move_to_end(task.id)
+        if len(self.tasks) > self.max_tasks:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used terminal tasks until back under budget.
+
+        In-flight tasks are never evicted, so the store may briefly exceed
+        max_tasks while many tasks are still working.
+        """
+        excess = len(self.tasks) - self.max_tasks
+        stale: list[str] = []
+        for task_id, task in self.tasks.items():
+            if len(stale) >= excess:
+                break
+            if task.status.state in _TERMINAL_STATES:
+                stale.append(task_id)
+        for task_id in stale:
+            del self.tasks[task_id]
 
     async def process_task(
         self, task: Task, message: Message, model: str | None = None
     ) -> Task:
         """Process a task by sending the user message to the configured backend."""
         task.history.append(message)
-        task.status = TaskStatus(state=TaskState.WORKING)
+        task.status = TaskStatus(state="working")
 
         try:
-            user_text = " ".join(
-                p.text for p in message.parts if hasattr(p, "text")
-            )
-
-            if config.is_lmstudio:
-                response_text = await self._query_lmstudio(user_text, model=model)
-            else:
-                response_text = await self._query_claude(user_text)
+            user_text = " ".join([p.text for p in message.parts])
+
+            cache_key = self._response_cache.key(user_text, model)
+            generation = self._response_cache.generation
+            response_text = self._response_cache.get(cache_key)
+            if response_text is None:
+                if config.is_lmstudio:
+                    response_text, tools_used, tool_failed = (
+                        await self._query_lmstudio(user_text, model=model)
+                    )
+                else:
+                    response_text, tools_used, tool_failed = (
+                        await self._query_claude(user_text)
+                    )
+
+                # Informational answers can be replayed briefly; a command
+                # changes TradingView state and invalidates everything cached.
+                # An answer built on a failed tool call is never cached.
+                if not all(is_read_only_tool(name) for name in tools_used):
+                    self._response_cache.clear()
+                elif not tool_failed:
+                    self._response_cache.put(
+                        cache_key, response_text, generation
+                    )
 
             agent_message = Message(
                 role="agent", parts=[TextPart(text=response_text)]
             )
             task.history.append(agent_message)
-            task.status = TaskStatus(
-                state=TaskState.COMPLETED, message=agent_message
-            )
+            task.status = TaskStatus(state="completed", message=agent_message)
         except Exception as e:
             logger.exception("Error processing task %s", task.id)
             error_message = Message(
                 role="agent", parts=[TextPart(text=f"Error: {e}")]
             )
-            task.status = TaskStatus(
-                state=TaskState.FAILED, message=error_message
-            )
+            task.status = TaskStatus(state="failed", message=error_message)
 
         return task
 
-    async def _query_claude(self, prompt: str) -> str:
-        """Send prompt to Claude with MCP tools, collect response text."""
+    async def _query_claude(self, prompt: str) -> tuple[str, list[str], bool]:
+        """Send prompt to Claude with MCP tools.
+
+        Returns (response_text, names of tools Claude called, whether any
+        tool call failed).
+        """
         options = build_claude_options(permission_mode="bypassPermissions")
 
-        result_parts = []
+        buf = io.StringIO()
+        tools_used: list[str] = []
+        tool_failed = False
         async with ClaudeSDKClient(options=options) as client:
             await client.query(prompt)
             async for msg in client.receive_response():
-                if isinstance(msg, AssistantMessage):
-                    for block in msg.content:
-                        if isinstance(block, TextBlock):
-                            result_parts.append(block.text)
-
-        return "\n".join(result_parts) if result_parts else "No response generated."
-
-    async def _query_lmstudio(self, prompt: str, model: str | None = None) -> str:
-        """Send prompt to LM Studio with MCP tools, collect response text."""
-        from ..lmstudio import LMStudioAgent
-
-        async with LMStudioAgent(model=model) as agent:
-            response = await agent.query(prompt)
-            return response.text
+                # Exact type checks: the SDK's message classes aren't subclassed.
+                msg_type = type(msg)
+                if msg_type is UserMessage:
+                    # Tool results come back to Claude as user turns.
+                    if isinstance(msg.content, list) and any(
+                        type(block) is ToolResultBlock and block.is_error
+                        for block in msg.content
+                    ):
+                        tool_failed = True
+                    continue
+                if msg_type is not AssistantMessage:
+                    continue
+                for block in msg.content:
+                    block_type = type(block)
+                    if block_type is TextBlock:
+                        if buf.tell():
+                            buf.write("\n")
+                        buf.write(block.text)
+                    elif block_type is ToolUseBlock:
+                        tools_used.append(block.name)
+
+        return buf.getvalue() or "No response generated.", tools_used, tool_failed
+
+    async def _query_lmstudio(
+        self, prompt: str, model: str | None = None
+    ) -> tuple[str, list[str], bool]:
+        """Send prompt to LM Studio with MCP tools.
+
+        Returns (response_text, names of tools the model called, whether any
+        tool call failed).
+        """
+        agent = await self._get_lmstudio_agent()
+        response = await agent.query(prompt, model=model)
+        return response.text, response.tool_calls_made, response.tool_failed
+
+    async def _get_lmstudio_agent(self) -> "LMStudioAgent":
+        """Return the shared LM Studio agent, starting it on first use.
+
+        The MCP subprocess, tool catalog and HTTP client stay warm across
+        tasks instead of being rebuilt per request. If the MCP subprocess
+        has died, the agent is replaced so later tasks recover.
+        """
+        agent = self._lmstudio_agent
+        if agent is not None and agent.is_alive:
+            return agent
+        async with self._lmstudio_lock:
+            agent = self._lmstudio_agent
+            if agent is not None and agent.is_alive:
+                return agent
+            if agent is not None:
+                logger.warning("MCP subprocess died; restarting LM Studio agent")
+                self._lmstudio_agent = None
+                await agent.stop()
+
+            from ..lmstudio import LMStudioAgent
+
+            agent = LMStudioAgent()
+            try:
+                await agent.start()
+            except Exception:
+                await agent.stop()
+                raise
+            self._lmstudio_agent = agent
+            return agent
+
+    async def aclose(self) -> None:
+        """Shut down the shared LM Studio agent, if one was started."""
+        if self._lmstudio_agent is not None:
+            await self._lmstudio_agent.stop()
+            self._lmstudio_agent = None
 
 
 task_handler = TaskHandler()
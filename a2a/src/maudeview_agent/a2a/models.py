@@ -1,80 +1,108 @@
 """A2A protocol models based on the Agent2Agent specification."""
 
-from datetime import datetime, timezone
-from enum import Enum
-from typing import Any
-from uuid import uuid4
+import secrets
+import time
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+import msgspec
 
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") of the last timestamp
+_last_second: tuple[int, str] = (-1, "")
 
-class TaskState(str, Enum):
-    """Task lifecycle states."""
 
-    SUBMITTED = "submitted"
-    WORKING = "working"
-    INPUT_REQUIRED = "input-required"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    CANCELED = "canceled"
+def _utc_now_iso() -> str:
+    """Current UTC time as ISO 8601, same shape as datetime.isoformat().
 
+    The date/time prefix is only reformatted when the second rolls over.
+    """
+    global _last_second
 
-class TextPart(BaseModel):
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _last_second
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _last_second = (sec, prefix)
+    return f"{prefix}.{ns // 1000:06d}+00:00"
+
+
+def _new_id() -> str:
+    """Random 128-bit hex id for server-generated task/context/message ids.
+
+    Ids must stay unguessable: anyone holding a task id can read its full
+    history via tasks/get.
+    """
+    return secrets.token_hex(16)
+
+
+TaskState = Literal[
+    "submitted",
+    "working",
+    "input-required",
+    "completed",
+    "failed",
+    "canceled",
+]
+"""Task lifecycle states."""
+
+
+class TextPart(msgspec.Struct, kw_only=True):
     """Text content part. Uses 'kind' as discriminator per newer A2A spec."""
 
     kind: str = "text"
     text: str
-
-    class Config:
-        extra = "allow"
+    metadata: dict[str, Any] | None = None
 
 
-class Message(BaseModel):
+class Message(msgspec.Struct, kw_only=True):
     """A2A message in a task."""
 
     kind: str = "message"
-    messageId: str = Field(default_factory=lambda: str(uuid4()))
+    messageId: str = msgspec.field(default_factory=_new_id)
     role: str  # "user" or "agent"
     parts: list[TextPart]
-
-    class Config:
-        extra = "allow"
+    # Optional A2A fields, declared so client values round-trip into history
+    contextId: str | None = None
+    taskId: str | None = None
+    referenceTaskIds: list[str] | None = None
+    metadata: dict[str, Any] | None = None
 
 
-class TaskStatus(BaseModel):
+class TaskStatus(msgspec.Struct, kw_only=True):
     """Current status of a task."""
 
     state: TaskState
     message: Message | None = None
-    timestamp: str = Field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
-    )
+    timestamp: str = msgspec.field(default_factory=_utc_now_iso)
 
 
-class Task(BaseModel):
+class Task(msgspec.Struct, kw_only=True):
     """A2A task representation."""
 
     kind: str = "task"
-    id: str = Field(default_factory=lambda: str(uuid4()))
-    contextId: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = msgspec.field(default_factory=_new_id)
+    contextId: str = msgspec.field(default_factory=_new_id)
     status: TaskStatus
-    history: list[Message] = Field(default_factory=list)
-    artifacts: list[dict[str, Any]] = Field(default_factory=list)
+    history: list[Message] = msgspec.field(default_factory=list)
+    artifacts: list[dict[str, Any]] = msgspec.field(default_factory=list)
 
 
 # JSON-RPC Models
 
 
-class JsonRpcRequest(BaseModel):
-    """JSON-RPC 2.0 request."""
+class JsonRpcRequest(msgspec.Struct, kw_only=True):
+    """JSON-RPC 2.0 request.
+
+    params is kept as undecoded JSON so each method can decode it straight
+    into its own params struct.
+    """
 
     jsonrpc: str = "2.0"
     id: str | int
     method: str
-    params: dict[str, Any] = Field(default_factory=dict)
+    params: msgspec.Raw = msgspec.Raw(b"{}")
 
 
-class JsonRpcResponse(BaseModel):
+class JsonRpcResponse(msgspec.Struct, kw_only=True):
     """JSON-RPC 2.0 response."""
 
     jsonrpc: str = "2.0"
@@ -83,7 +111,7 @@ class JsonRpcResponse(BaseModel):
     error: dict[str, Any] | None = None
 
 
-class JsonRpcError(BaseModel):
+class JsonRpcError(msgspec.Struct, kw_only=True):
     """JSON-RPC 2.0 error object."""
 
     code: int
@@ -94,24 +122,21 @@ class JsonRpcError(BaseModel):
 # A2A specific params
 
 
-class TaskSendParams(BaseModel):
+class TaskSendParams(msgspec.Struct, kw_only=True):
     """Parameters for tasks/send and message/send methods."""
 
     message: Message
     id: str | None = None
     model: str | None = None
 
-    class Config:
-        extra = "allow"
-
 
-class TaskGetParams(BaseModel):
+class TaskGetParams(msgspec.Struct, kw_only=True):
     """Parameters for tasks/get method."""
 
     id: str
 
 
-class TaskCancelParams(BaseModel):
+class TaskCancelParams(msgspec.Struct, kw_only=True):
     """Parameters for tasks/cancel method."""
 
     id: str
@@ -2,13 +2,15 @@
 
 import json
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
 import httpx
+import msgspec
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from ..config import config
 from .handler import task_handler
@@ -18,7 +20,6 @@ from .models import (
     TaskCancelParams,
     TaskGetParams,
     TaskSendParams,
-    TaskState,
     TaskStatus,
 )
 
@@ -26,13 +27,41 @@ logger = logging.getLogger(__name__)
 
 AGENT_CARD_PATH = Path(__file__).parent.parent.parent.parent / "agent-card.json"
 
+_REQ_DEC = msgspec.json.Decoder(JsonRpcRequest)
+_SEND_PARAMS_DEC = msgspec.json.Decoder(TaskSendParams)
+_GET_PARAMS_DEC = msgspec.json.Decoder(TaskGetParams)
+_CANCEL_PARAMS_DEC = msgspec.json.Decoder(TaskCancelParams)
+_ENC = msgspec.json.Encoder()
+
+
+class _RpcError(Exception):
+    """Expected JSON-RPC failure, reported to the client without a traceback."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+def _json_response(content: Any) -> Response:
+    """Encode content with msgspec and wrap it in a JSON response."""
+    return Response(content=_ENC.encode(content), media_type="application/json")
+
+
+def _rpc_error_response(req_id: str | int | None, code: int, message: str) -> Response:
+    """Build a JSON-RPC 2.0 error response."""
+    return _json_response({
+        "jsonrpc": "2.0",
+        "id": req_id,
+        "error": {"code": code, "message": message},
+    })
+
 
 def _load_agent_card() -> dict[str, Any]:
     """Load the agent card from JSON file, injecting the configured URL."""
-    if AGENT_CARD_PATH.exists():
+    try:
         with open(AGENT_CARD_PATH) as f:
             card = json.load(f)
-    else:
+    except FileNotFoundError:
         card = {
             "name": "MaudeView Agent",
             "description": "TradingView chart control agent",
@@ -42,15 +71,45 @@ def _load_agent_card() -> dict[str, Any]:
     return card
 
 
+_AGENT_CARD_DICT = _load_agent_card()
+_AGENT_CARD_BYTES = _ENC.encode(_AGENT_CARD_DICT)
+
+
+_LMS_CLIENT: httpx.AsyncClient | None = None
+
+
 async def _fetch_lmstudio_models() -> list[dict[str, Any]]:
     """Fetch loaded models from LM Studio's /api/v0/models endpoint."""
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        resp = await client.get(
-            f"{config.lmstudio_base_url.rstrip('/')}/api/v0/models",
+    assert _LMS_CLIENT is not None, "LM Studio client not started"
+
+    resp = await _LMS_CLIENT.get("/api/v0/models")
+    resp.raise_for_status()
+    all_models = resp.json().get("data", [])
+    return [m for m in all_models if m.get("state") == "loaded"]
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    """Hold LM Studio resources open for the app's lifetime."""
+    global _LMS_CLIENT
+
+    if config.is_lmstudio:
+        _LMS_CLIENT = httpx.AsyncClient(
+            base_url=config.lmstudio_base_url,
+            timeout=httpx.Timeout(10.0, connect=2.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                keepalive_expiry=30.0,
+            ),
         )
-        resp.raise_for_status()
-        all_models = resp.json().get("data", [])
-        return [m for m in all_models if m.get("state") == "loaded"]
+    try:
+        yield
+    finally:
+        await task_handler.aclose()
+        if _LMS_CLIENT is not None:
+            await _LMS_CLIENT.aclose()
+            _LMS_CLIENT = None
 
 
 def create_a2a_app() -> FastAPI:
@@ -59,6 +118,7 @@ def create_a2a_app() -> FastAPI:
         title="MaudeView Agent - A2A",
         description="Agent-to-Agent protocol server for TradingView chart control",
         version="1.0.0",
+        lifespan=_lifespan,
     )
 
     app.add_middleware(
@@ -72,78 +132,69 @@ def create_a2a_app() -> FastAPI:
     @app.get("/.well-known/agent-card.json")
     async def get_agent_card():
         """Serve the A2A agent card for discovery."""
-        return JSONResponse(content=_load_agent_card())
+        return Response(content=_AGENT_CARD_BYTES, media_type="application/json")
 
     @app.get("/agent-card.json")
     async def get_agent_card_alt():
         """Alternative path for agent card."""
-        return JSONResponse(content=_load_agent_card())
+        return Response(content=_AGENT_CARD_BYTES, media_type="application/json")
 
     @app.post("/a2a")
     async def handle_a2a_request(request: Request):
         """Handle A2A JSON-RPC requests."""
         try:
-            body = await request.json()
-            rpc_request = JsonRpcRequest(**body)
-        except Exception as e:
-            return JSONResponse(
-                content={
-                    "jsonrpc": "2.0",
-                    "id": None,
-                    "error": {"code": -32700, "message": f"Parse error: {e}"},
-                }
-            )
+            rpc_request = _REQ_DEC.decode(await request.body())
+        except msgspec.ValidationError as e:
+            return _rpc_error_response(None, -32600, f"Invalid request: {e}")
+        except msgspec.DecodeError as e:
+            return _rpc_error_response(None, -32700, f"Parse error: {e}")
 
         try:
             result = await _handle_rpc_method(rpc_request)
-
-            # The a2a-client Rust library expects message/send and tasks/send
-            # responses to have a double-wrapped JSON-RPC envelope:
-            # the outer result field must itself be a JSON-RPC success response
-            # containing the actual result (SendMessageSuccessResponse layout).
-            if rpc_request.method in ("tasks/send", "message/send"):
-                result = {
-                    "jsonrpc": "2.0",
-                    "id": rpc_request.id,
-                    "result": result,
-                }
-
-            return JSONResponse(
-                content={
-                    "jsonrpc": "2.0",
-                    "id": rpc_request.id,
-                    "result": result,
-                }
+        except _RpcError as e:
+            return _rpc_error_response(rpc_request.id, e.code, str(e))
+        except msgspec.ValidationError as e:
+            return _rpc_error_response(
+                rpc_request.id, -32602, f"Invalid params: {e}"
             )
         except Exception as e:
             logger.exception("Error handling A2A request")
-            return JSONResponse(
-                content={
-                    "jsonrpc": "2.0",
-                    "id": rpc_request.id,
-                    "error": {"code": -32603, "message": str(e)},
-                }
-            )
+            return _rpc_error_response(rpc_request.id, -32603, str(e))
+
+        # The a2a-client Rust library expects message/send and tasks/send
+        # responses to have a double-wrapped JSON-RPC envelope:
+        # the outer result field must itself be a JSON-RPC success response
+        # containing the actual result (SendMessageSuccessResponse layout).
+        if rpc_request.method in ("tasks/send", "message/send"):
+            result = {
+                "jsonrpc": "2.0",
+                "id": rpc_request.id,
+                "result": result,
+            }
+
+        return _json_response({
+            "jsonrpc": "2.0",
+            "id": rpc_request.id,
+            "result": result,
+        })
 
     @app.get("/models")
     async def list_models():
         """List available LM Studio models."""
         if not config.is_lmstudio:
-            return JSONResponse(
-                content={"models": [], "note": "Backend is not LM Studio"},
-            )
+            return _json_response({"models": [], "note": "Backend is not LM Studio"})
         models = await _fetch_lmstudio_models()
-        return JSONResponse(content={"models": models})
+        return _json_response({"models": models})
 
     @app.get("/health")
     async def health_check():
         """Health check endpoint."""
-        return {"status": "ok", "agent": "maudeview-watchlist-manager"}
+        return _json_response({"status": "ok", "agent": "maudeview-watchlist-manager"})
 
     return app
 
 
-async def _handle_rpc_method(request: JsonRpcRequest) -> dict[str, Any]:
+async def _handle_rpc_method(request: JsonRpcRequest) -> Task | dict[str, Any]:
     """Route JSON-RPC method to handler."""
     method = request.method
     params = request.params
@@ -157,28 +208,22 @@ async def _handle_rpc_method(request: JsonRpcRequest) -> dict[str, Any]:
     elif method == "models/list":
         return await _handle_models_list()
     elif method == "agent/info":
-        return _load_agent_card()
+        return _AGENT_CARD_DICT
     else:
-        raise ValueError(f"Unknown method: {method}")
+        raise _RpcError(-32601, f"Unknown method: {method}")
 
 
-async def _handle_tasks_send(params: dict[str, Any]) -> dict[str, Any]:
+async def _handle_tasks_send(params: msgspec.Raw) -> Task:
     """Handle tasks/send - create or continue a task."""
-    send_params = TaskSendParams(**params)
-
-    task_id = send_params.id
-    if task_id and task_id in task_handler.tasks:
-        task = task_handler.tasks[task_id]
-    else:
-        task = Task(status=TaskStatus(state=TaskState.SUBMITTED))
-        task_handler.tasks[task.id] = task
+    send_params = _SEND_PARAMS_DEC.decode(params)
 
+    task = task_handler.get_or_create_task(send_params.id)
     task = await task_handler.process_task(
         task, send_params.message, model=send_params.model
     )
-    task_handler.tasks[task.id] = task
+    task_handler.store_task(task)
 
-    return task.model_dump()
+    return task
 
 
 async def _handle_models_list() -> dict[str, Any]:
@@ -189,29 +234,29 @@ async def _handle_models_list() -> dict[str, Any]:
     return {"models": models}
 
 
-async def _handle_tasks_get(params: dict[str, Any]) -> dict[str, Any]:
+async def _handle_tasks_get(params: msgspec.Raw) -> Task:
     """Handle tasks/get - get task status."""
-    get_params = TaskGetParams(**params)
+    get_params = _GET_PARAMS_DEC.decode(params)
 
-    if get_params.id not in task_handler.tasks:
-        raise ValueError(f"Task not found: {get_params.id}")
+    task = task_handler.get_task(get_params.id)
+    if task is None:
+        raise _RpcError(-32001, f"Task not found: {get_params.id}")
 
-    task = task_handler.tasks[get_params.id]
-    return task.model_dump()
+    return task
 
 
-async def _handle_tasks_cancel(params: dict[str, Any]) -> dict[str, Any]:
+async def _handle_tasks_cancel(params: msgspec.Raw) -> Task:
     """Handle tasks/cancel - cancel a task."""
-    cancel_params = TaskCancelParams(**params)
+    cancel_params = _CANCEL_PARAMS_DEC.decode(params)
 
-    if cancel_params.id not in task_handler.tasks:
-        raise ValueError(f"Task not found: {cancel_params.id}")
+    task = task_handler.get_task(cancel_params.id)
+    if task is None:
+        raise _RpcError(-32001, f"Task not found: {cancel_params.id}")
 
-    task = task_handler.tasks[cancel_params.id]
-    task.status = TaskStatus(state=TaskState.CANCELED)
-    task_handler.tasks[task.id] = task
+    task.status = TaskStatus(state="canceled")
+    task_handler.store_task(task)
 
-    return task.model_dump()
+    return task
 
 
 def run_a2a_server():
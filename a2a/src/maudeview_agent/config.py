@@ -5,7 +5,7 @@ from os import environ
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
     """Agent configuration with environment variable support."""
 
@@ -14,6 +14,8 @@ class Config:
     a2a_host: str = "0.0.0.0"
     a2a_port: int = 8100
     a2a_url: str = "http://localhost:8100/a2a"
+    # Seconds to reuse answers to read-only prompts; 0 disables the cache
+    a2a_response_cache_ttl: float = 60.0
 
     # Backend selection: "claude" or "lmstudio"
     agent_backend: str = "claude"
@@ -24,27 +26,34 @@ class Config:
     @classmethod
     def from_env(cls) -> "Config":
         """Create configuration from environment variables."""
-        raw_path = environ.get("MCP_BINARY_PATH", str(cls.mcp_binary_path))
+        # Slotted dataclasses don't keep field defaults as class attributes.
+        defaults = cls()
+        raw_path = environ.get("MCP_BINARY_PATH", str(defaults.mcp_binary_path))
         resolved = Path(raw_path)
         if not resolved.is_absolute():
             resolved = (Path.cwd() / raw_path).resolve()
 
         return cls(
             controller_bind_addr=environ.get(
-                "CONTROLLER_BIND_ADDR", cls.controller_bind_addr
+                "CONTROLLER_BIND_ADDR", defaults.controller_bind_addr
             ),
             mcp_binary_path=resolved,
-            a2a_host=environ.get("A2A_HOST", cls.a2a_host),
-            a2a_port=int(environ.get("A2A_PORT", str(cls.a2a_port))),
-            a2a_url=environ.get("A2A_URL", cls.a2a_url),
-            agent_backend=environ.get("AGENT_BACKEND", cls.agent_backend),
-            lmstudio_base_url=environ.get(
-                "LMSTUDIO_BASE_URL", cls.lmstudio_base_url
+            a2a_host=environ.get("A2A_HOST", defaults.a2a_host),
+            a2a_port=int(environ.get("A2A_PORT", str(defaults.a2a_port))),
+            a2a_url=environ.get("A2A_URL", defaults.a2a_url),
+            a2a_response_cache_ttl=float(
+                environ.get(
+                    "A2A_RESPONSE_CACHE_TTL", str(defaults.a2a_response_cache_ttl)
+                )
             ),
+            agent_backend=environ.get("AGENT_BACKEND", defaults.agent_backend),
+            lmstudio_base_url=environ.get(
+                "LMSTUDIO_BASE_URL", defaults.lmstudio_base_url
+            ).rstrip("/"),
             lmstudio_auth_token=environ.get(
-                "LMSTUDIO_AUTH_TOKEN", cls.lmstudio_auth_token
+                "LMSTUDIO_AUTH_TOKEN", defaults.lmstudio_auth_token
             ),
-            lmstudio_model=environ.get("LMSTUDIO_MODEL", cls.lmstudio_model),
+            lmstudio_model=environ.get("LMSTUDIO_MODEL", defaults.lmstudio_model),
         )
 
     @property
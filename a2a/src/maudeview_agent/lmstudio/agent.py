@@ -5,6 +5,8 @@ import logging
 from dataclasses import dataclass, field
 from typing import Any
 
+import msgspec
+
 from ..config import config
 from ..prompts import ALLOWED_TOOLS, SYSTEM_PROMPT
 from .llm_client import LMStudioClient, mcp_tools_to_anthropic
@@ -13,7 +15,10 @@ from .mcp_subprocess import MCPSubprocess
 logger = logging.getLogger(__name__)
 
 # Bare tool names allowed (strip mcp__maudeview__ prefix)
-_ALLOWED_BARE = {t.split("__")[-1] for t in ALLOWED_TOOLS}
+_ALLOWED_BARE = frozenset(t.split("__")[-1] for t in ALLOWED_TOOLS)
+# Spliced verbatim into every LLM request instead of re-escaping ~2.6 KB
+# of prompt text per turn.
+_SYSTEM_PROMPT_JSON = msgspec.Raw(msgspec.json.encode(SYSTEM_PROMPT))
 
 
 @dataclass
@@ -22,6 +27,7 @@ class AgentResponse:
 
     text: str
     tool_calls_made: list[str] = field(default_factory=list)
+    tool_failed: bool = False  # any tool call returned is_error
 
 
 class LMStudioAgent:
@@ -42,6 +48,7 @@ class LMStudioAgent:
         self._mcp: MCPSubprocess | None = None
         self._llm: LMStudioClient | None = None
         self._tools_anthropic: list[dict[str, Any]] = []
+        self._tools_payload: list[dict[str, Any]] | msgspec.Raw = []
 
     async def start(self) -> None:
         """Start MCP subprocess and LLM client, fetch and filter tools."""
@@ -54,6 +61,12 @@ class LMStudioAgent:
         # Filter to allowed tools
         filtered = [t for t in mcp_tools if t["name"] in _ALLOWED_BARE]
         self._tools_anthropic = mcp_tools_to_anthropic(filtered)
+        # The catalog is fixed for the agent's lifetime: encode it once and
+        # let every LLM request splice in the bytes verbatim.
+        if self._tools_anthropic:
+            self._tools_payload = msgspec.Raw(
+                msgspec.json.encode(self._tools_anthropic)
+            )
         logger.info(
             "Filtered %d/%d MCP tools for LLM", len(filtered), len(mcp_tools)
         )
@@ -72,11 +85,22 @@ class LMStudioAgent:
         if self._mcp:
             await self._mcp.stop()
 
-    async def query(self, user_message: str, max_turns: int = 50) -> AgentResponse:
+    @property
+    def is_alive(self) -> bool:
+        """True while the MCP subprocess can still serve tool calls."""
+        return self._mcp is not None and self._mcp.is_alive
+
+    async def query(
+        self,
+        user_message: str,
+        max_turns: int = 50,
+        model: str | None = None,
+    ) -> AgentResponse:
         """Run the agentic loop: LLM call -> tool dispatch -> repeat.
 
         Returns when the LLM produces a text response with no tool_use blocks,
-        or max_turns is reached.
+        or max_turns is reached. ``model`` overrides the agent's default model
+        for this query only.
         """
         assert self._llm and self._mcp, "Agent not started"
 
@@ -84,12 +108,14 @@ class LMStudioAgent:
             {"role": "user", "content": user_message},
         ]
         tool_calls_made: list[str] = []
+        tool_failed = False
 
         for turn in range(max_turns):
             response = await self._llm.send_messages(
-                system=SYSTEM_PROMPT,
+                system=_SYSTEM_PROMPT_JSON,
                 messages=messages,
-                tools=self._tools_anthropic,
+                tools=self._tools_payload,
+                model=model,
             )
 
             content = response.get("content", [])
@@ -111,6 +137,7 @@ class LMStudioAgent:
                 return AgentResponse(
                     text="\n".join(text_parts) or "(no text response)",
                     tool_calls_made=tool_calls_made,
+                    tool_failed=tool_failed,
                 )
 
             # Execute each tool and build tool_result blocks
@@ -130,6 +157,7 @@ class LMStudioAgent:
                     is_error = True
                     logger.exception("MCP call_tool failed: %s", tool_name)
 
+                tool_failed = tool_failed or is_error
                 tool_results.append({
                     "type": "tool_result",
                     "tool_use_id": tool_id,
@@ -146,6 +174,7 @@ class LMStudioAgent:
         return AgentResponse(
             text="(max turns reached without final response)",
             tool_calls_made=tool_calls_made,
+            tool_failed=tool_failed,
         )
 
     # -- context manager --
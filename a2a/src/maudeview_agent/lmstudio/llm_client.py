@@ -4,6 +4,7 @@ import logging
 from typing import Any
 
 import httpx
+import msgspec
 
 logger = logging.getLogger(__name__)
 
@@ -12,13 +13,14 @@ def mcp_tools_to_anthropic(mcp_tools: list[dict[str, Any]]) -> list[dict[str, An
     """Convert MCP tool definitions to Anthropic tool_use format.
 
     Ensures every input_schema has a "properties" key — LM Studio requires it
-    even for no-argument tools.
+    even for no-argument tools. Schemas that already have one are reused by
+    reference rather than copied.
     """
     result = []
     for tool in mcp_tools:
-        schema = dict(tool.get("inputSchema", {"type": "object"}))
+        schema = tool.get("inputSchema") or {"type": "object"}
         if "properties" not in schema:
-            schema["properties"] = {}
+            schema = {**schema, "properties": {}}
         result.append({
             "name": tool["name"],
             "description": tool.get("description", ""),
@@ -36,7 +38,7 @@ class LMStudioClient:
         auth_token: str = "lmstudio",
         model: str = "",
     ):
-        self.base_url = base_url.rstrip("/")
+        self.base_url = base_url
         self.auth_token = auth_token
         self.model = model
         self._client: httpx.AsyncClient | None = None
@@ -54,19 +56,23 @@ class LMStudioClient:
 
     async def send_messages(
         self,
-        system: str,
+        system: str | msgspec.Raw,
         messages: list[dict[str, Any]],
-        tools: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | msgspec.Raw,
         max_tokens: int = 4096,
+        model: str | None = None,
     ) -> dict[str, Any]:
         """POST /v1/messages with Anthropic-compatible payload.
 
+        ``system`` and ``tools`` may be pre-encoded ``msgspec.Raw`` JSON (a
+        string and an array), which are copied into the request body as-is.
+        ``model`` overrides the client's default model for this call.
         Returns the parsed JSON response.
         """
         assert self._client is not None, "Client not started"
 
         payload: dict[str, Any] = {
-            "model": self.model,
+            "model": model or self.model,
             "max_tokens": max_tokens,
             "system": system,
             "messages": messages,
@@ -80,8 +86,10 @@ class LMStudioClient:
             "content-type": "application/json",
         }
 
-        logger.debug("LLM request: %d messages, %d tools", len(messages), len(tools))
-        resp = await self._client.post("/v1/messages", json=payload, headers=headers)
+        logger.debug("LLM request: %d messages", len(messages))
+        resp = await self._client.post(
+            "/v1/messages", content=msgspec.json.encode(payload), headers=headers
+        )
         if resp.status_code >= 400:
             logger.error(
                 "LLM error %d: %s", resp.status_code, resp.text[:500]
@@ -1,44 +1,92 @@
 """MCP subprocess manager — spawn Go binary, speak JSON-RPC 2.0 over stdio."""
 
 import asyncio
-import json
+import itertools
 import logging
-import signal
+import os
 from typing import Any
 
+import msgspec
+
 logger = logging.getLogger(__name__)
 
+_ENC = msgspec.json.Encoder()
+_DEC = msgspec.json.Decoder()
+
+
+class _Request(msgspec.Struct, kw_only=True):
+    """Outgoing JSON-RPC 2.0 request envelope."""
+
+    jsonrpc: str = "2.0"
+    id: int
+    method: str
+    params: dict[str, Any]
+
+
+class _Notification(msgspec.Struct, kw_only=True):
+    """Outgoing JSON-RPC 2.0 notification envelope (no id)."""
+
+    jsonrpc: str = "2.0"
+    method: str
+    params: dict[str, Any]
+
+
+_READ_CHUNK = 64 * 1024
+# StreamReader limit for stdout: the transport is only paused once this much
+# is buffered, so large tools/list responses arrive without stalling.
+_STDOUT_LIMIT = 1 << 20
+# stdin high-water mark: drain() only blocks once this much is unsent.
+_STDIN_HIGH_WATER = 512 * 1024
+# How long stop() waits for the child to exit on stdin EOF before SIGTERM.
+_EOF_GRACE = 1.0
+
 
 class MCPSubprocess:
     """Async context manager that runs an MCP server as a child process.
 
-    Speaks JSON-RPC 2.0 over stdin/stdout (newline-delimited JSON).
+    Speaks JSON-RPC 2.0 over stdin/stdout (newline-delimited JSON). Requests
+    are pipelined: a single background reader resolves each response to the
+    caller waiting on its id, so concurrent tool calls don't queue behind
+    one another.
     """
 
     def __init__(self, binary_path: str, env: dict[str, str] | None = None):
         self.binary_path = binary_path
         self.env = env
+        # Fixed for the object's lifetime; None lets the child inherit
+        # os.environ directly without copying it.
+        self._merged_env = {**os.environ, **env} if env else None
         self._process: asyncio.subprocess.Process | None = None
-        self._request_id = 0
-        self._tools: list[dict[str, Any]] = []
-        self._lock = asyncio.Lock()
+        self._request_ids = itertools.count(1)
+        self._tools: tuple[dict[str, Any], ...] = ()
+        self._tools_by_name: dict[str, dict[str, Any]] = {}
+        self._lock = asyncio.Lock()  # serializes writes to stdin
+        self._rxbuf = bytearray()
+        self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        self._reader_task: asyncio.Task[None] | None = None
+        self._reader_error: Exception | None = None
 
-    async def start(self) -> list[dict[str, Any]]:
+    async def start(self) -> tuple[dict[str, Any], ...]:
         """Spawn the MCP binary and perform the initialize handshake.
 
-        Returns the list of tools from tools/list.
+        Returns the tools from tools/list.
         """
-        import os
-
-        merged_env = {**os.environ, **(self.env or {})}
+        self._rxbuf.clear()
         self._process = await asyncio.create_subprocess_exec(
             self.binary_path,
             stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
-            env=merged_env,
+            env=self._merged_env,
+            limit=_STDOUT_LIMIT,
+        )
+        assert self._process.stdin is not None
+        self._process.stdin.transport.set_write_buffer_limits(
+            high=_STDIN_HIGH_WATER
         )
         logger.info("MCP subprocess started (pid=%d)", self._process.pid)
+        self._reader_error = None
+        self._reader_task = asyncio.create_task(self._reader_loop())
 
         # Initialize handshake
         init_result = await self._send_request("initialize", {
@@ -53,7 +101,8 @@ class MCPSubprocess:
 
         # Get tool list
         tools_result = await self._send_request("tools/list", {})
-        self._tools = tools_result.get("tools", [])
+        self._tools = tuple(tools_result.get("tools", ()))
+        self._tools_by_name = {t["name"]: t for t in self._tools}
         logger.info("MCP server exposes %d tools", len(self._tools))
         return self._tools
 
@@ -62,108 +111,192 @@ class MCPSubprocess:
     ) -> tuple[str, bool]:
         """Execute a tool via tools/call.
 
-        Returns (content_text, is_error).
+        Returns (content_text, is_error). Raises ValueError if the server
+        did not list the tool.
         """
+        if name not in self._tools_by_name:
+            raise ValueError(f"Unknown MCP tool: {name}")
         result = await self._send_request("tools/call", {
             "name": name,
             "arguments": arguments,
         })
         is_error = result.get("isError", False)
-        content_parts = result.get("content", [])
-        text_parts = [
-            p.get("text", "") for p in content_parts if p.get("type") == "text"
-        ]
-        return "\n".join(text_parts), is_error
+        # MCP requires "text" on text content, so subscript it directly.
+        # join() materializes its argument anyway, so a list comprehension
+        # beats a generator here.
+        text = "\n".join([
+            p["text"] for p in result.get("content", []) if p.get("type") == "text"
+        ])
+        return text, is_error
 
     async def stop(self) -> None:
         """Gracefully stop the MCP subprocess."""
-        if self._process is None or self._process.returncode is not None:
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+
+        process = self._process
+        if process is None or process.returncode is not None:
             return
 
+        # EOF on stdin lets a stdio MCP server exit through its own
+        # shutdown path; signals are only the fallback.
+        if process.stdin is not None:
+            process.stdin.close()
         try:
-            self._process.send_signal(signal.SIGTERM)
+            await asyncio.wait_for(process.wait(), timeout=_EOF_GRACE)
+        except asyncio.TimeoutError:
             try:
-                await asyncio.wait_for(self._process.wait(), timeout=5.0)
+                process.terminate()
+                await asyncio.wait_for(process.wait(), timeout=5.0)
+            except ProcessLookupError:
+                pass
             except asyncio.TimeoutError:
                 logger.warning("MCP subprocess did not exit, sending SIGKILL")
-                self._process.kill()
-                await self._process.wait()
-        except ProcessLookupError:
-            pass
+                process.kill()
+                await process.wait()
         logger.info("MCP subprocess stopped")
 
     @property
-    def tools(self) -> list[dict[str, Any]]:
+    def is_alive(self) -> bool:
+        """True while the child is running and its connection is usable."""
+        return (
+            self._process is not None
+            and self._process.returncode is None
+            and self._reader_error is None
+        )
+
+    @property
+    def tools(self) -> tuple[dict[str, Any], ...]:
         return self._tools
 
+    def tool(self, name: str) -> dict[str, Any] | None:
+        """Return the tools/list entry for name, or None if not listed."""
+        return self._tools_by_name.get(name)
+
     # -- internal JSON-RPC helpers --
 
     async def _send_request(
         self, method: str, params: dict[str, Any]
     ) -> dict[str, Any]:
-        """Send a JSON-RPC request and wait for the response."""
-        async with self._lock:
-            self._request_id += 1
-            req_id = self._request_id
-            message = {
-                "jsonrpc": "2.0",
-                "id": req_id,
-                "method": method,
-                "params": params,
-            }
-            await self._write(message)
-            return await self._read_response(req_id)
+        """Send a JSON-RPC request and wait for its response from the reader."""
+        if self._reader_error is not None:
+            raise RuntimeError(f"MCP connection is closed: {self._reader_error}")
+
+        req_id = next(self._request_ids)
+        fut: asyncio.Future[dict[str, Any]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._pending[req_id] = fut
+        try:
+            async with self._lock:
+                await self._write(
+                    _Request(id=req_id, method=method, params=params)
+                )
+            return await fut
+        finally:
+            self._pending.pop(req_id, None)
 
     async def _send_notification(
         self, method: str, params: dict[str, Any]
     ) -> None:
         """Send a JSON-RPC notification (no id, no response expected)."""
         async with self._lock:
-            message = {
-                "jsonrpc": "2.0",
-                "method": method,
-                "params": params,
-            }
-            await self._write(message)
-
-    async def _write(self, message: dict[str, Any]) -> None:
+            await self._write(_Notification(method=method, params=params))
+
+    async def _write(self, message: _Request | _Notification) -> None:
         assert self._process and self._process.stdin
-        line = json.dumps(message) + "\n"
-        self._process.stdin.write(line.encode())
+        # Encode straight into the line buffer so the newline is appended
+        # in place rather than by copying the encoded message.
+        line = bytearray()
+        _ENC.encode_into(message, line)
+        line += b"\n"
+        self._process.stdin.write(line)
         await self._process.stdin.drain()
 
-    async def _read_response(self, expected_id: int) -> dict[str, Any]:
+    async def _reader_loop(self) -> None:
+        """Read stdout and resolve the pending request for each response.
+
+        stdout is read in large chunks into a persistent buffer. Complete
+        frames are decoded straight from memoryview slices of it, and the
+        consumed prefix is dropped once per chunk rather than once per frame.
+        """
         assert self._process and self._process.stdout
-        while True:
-            raw = await self._process.stdout.readline()
-            if not raw:
-                raise RuntimeError("MCP subprocess stdout closed unexpectedly")
-            line = raw.decode().strip()
-            if not line:
-                continue
-            try:
-                msg = json.loads(line)
-            except json.JSONDecodeError:
-                logger.debug("Skipping non-JSON line from MCP: %s", line[:200])
-                continue
-
-            # Skip notifications (no id)
-            if "id" not in msg:
-                logger.debug("MCP notification: %s", msg.get("method", "?"))
-                continue
-
-            if msg["id"] != expected_id:
-                logger.warning(
-                    "Unexpected response id %s (expected %s)", msg["id"], expected_id
-                )
-                continue
+        stdout = self._process.stdout
+        try:
+            while True:
+                chunk = await stdout.read(_READ_CHUNK)
+                if not chunk:
+                    raise RuntimeError("MCP subprocess stdout closed unexpectedly")
+                scan_from = len(self._rxbuf)
+                self._rxbuf += chunk
+                consumed = self._dispatch_frames(scan_from)
+                if consumed:
+                    del self._rxbuf[:consumed]
+        except asyncio.CancelledError:
+            self._fail_pending(RuntimeError("MCP subprocess stopped"))
+            raise
+        except Exception as e:
+            logger.error("MCP reader stopped: %s", e)
+            self._fail_pending(e)
+
+    def _dispatch_frames(self, scan_from: int) -> int:
+        """Handle every complete frame in the buffer; return bytes consumed.
 
-            if "error" in msg and msg["error"] is not None:
-                err = msg["error"]
-                raise RuntimeError(
-                    f"MCP error {err.get('code')}: {err.get('message')}"
+        Every view is released before returning, since the buffer can't be
+        resized while one is alive.
+        """
+        buf = self._rxbuf
+        start = 0
+        with memoryview(buf) as view:
+            while (idx := buf.find(b"\n", scan_from)) >= 0:
+                if idx > start:
+                    with view[start:idx] as frame:
+                        self._dispatch(frame)
+                start = scan_from = idx + 1
+        return start
+
+    def _dispatch(self, frame: memoryview) -> None:
+        """Decode one frame and resolve the matching pending request."""
+        try:
+            # Surrounding whitespace, including a trailing \r, is valid JSON.
+            msg = _DEC.decode(frame)
+        except msgspec.DecodeError:
+            if not frame.tobytes().isspace():
+                logger.debug(
+                    "Skipping non-JSON line from MCP: %r", frame[:200].tobytes()
                 )
-            return msg.get("result", {})
+            return
+
+        # Skip notifications (no id)
+        if "id" not in msg:
+            logger.debug("MCP notification: %s", msg.get("method", "?"))
+            return
+
+        fut = self._pending.pop(msg["id"], None)
+        if fut is None or fut.done():
+            logger.warning("Unexpected response id %s", msg["id"])
+            return
+
+        if "error" in msg and msg["error"] is not None:
+            err = msg["error"]
+            fut.set_exception(RuntimeError(
+                f"MCP error {err.get('code')}: {err.get('message')}"
+            ))
+        else:
+            fut.set_result(msg.get("result", {}))
+
+    def _fail_pending(self, exc: Exception) -> None:
+        """Fail every in-flight request; later requests fail fast."""
+        self._reader_error = exc
+        for fut in self._pending.values():
+            if not fut.done():
+                fut.set_exception(exc)
+        self._pending.clear()
 
     # -- context manager --
 
@@ -1,7 +1,10 @@
 """Interactive CLI for the MaudeView Agent."""
 
 import asyncio
+import functools
 import logging
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
 from claude_agent_sdk import (
     AssistantMessage,
@@ -10,70 +13,112 @@ from claude_agent_sdk import (
     TextBlock,
     ToolUseBlock,
 )
+from prompt_toolkit import PromptSession
 
 from .config import config
 from .options import build_claude_options
 
+if TYPE_CHECKING:
+    from .lmstudio import LMStudioAgent
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 
 
+def _print_text(block: TextBlock) -> None:
+    print(f"Assistant: {block.text}")
+
+
+def _print_tool_use(block: ToolUseBlock) -> None:
+    print(f"[Using tool: {block.name}]")
+
+
+def _handle_assistant(msg: AssistantMessage) -> None:
+    for block in msg.content:
+        handler = _BLOCK_HANDLERS.get(type(block))
+        if handler is not None:
+            handler(block)
+
+
+def _handle_result(msg: ResultMessage) -> None:
+    if msg.total_cost_usd:
+        print(f"\n[Cost: ${msg.total_cost_usd:.6f}]")
+
+
+_QUIT = frozenset({"quit", "exit", "q"})
+
+# Exact-type dispatch for streamed SDK messages; types not listed are ignored.
+_BLOCK_HANDLERS: dict[type, Callable[[Any], None]] = {
+    TextBlock: _print_text,
+    ToolUseBlock: _print_tool_use,
+}
+_MSG_HANDLERS: dict[type, Callable[[Any], None]] = {
+    AssistantMessage: _handle_assistant,
+    ResultMessage: _handle_result,
+}
+
+
 async def _run_claude_chat() -> None:
     """Interactive chat loop using Claude Agent SDK."""
     options = build_claude_options()
 
+    session: PromptSession[str] = PromptSession("You: ")
+
     async with ClaudeSDKClient(options=options) as client:
         while True:
             try:
-                user_input = input("You: ").strip()
+                user_input = (await session.prompt_async()).strip()
             except (EOFError, KeyboardInterrupt):
                 print("\nGoodbye!")
                 break
 
-            if user_input.lower() in ("quit", "exit", "q"):
-                print("Goodbye!")
-                break
-
             if not user_input:
                 continue
 
+            if user_input.lower() in _QUIT:
+                print("Goodbye!")
+                break
+
             await client.query(user_input)
 
             print()
             async for msg in client.receive_response():
-                if isinstance(msg, AssistantMessage):
-                    for block in msg.content:
-                        if isinstance(block, TextBlock):
-                            print(f"Assistant: {block.text}")
-                        elif isinstance(block, ToolUseBlock):
-                            print(f"[Using tool: {block.name}]")
-                elif isinstance(msg, ResultMessage):
-                    if msg.total_cost_usd:
-                        print(f"\n[Cost: ${msg.total_cost_usd:.6f}]")
+                handler = _MSG_HANDLERS.get(type(msg))
+                if handler is not None:
+                    handler(msg)
             print()
 
 
+@functools.cache
+def _get_lmstudio_agent_cls() -> type["LMStudioAgent"]:
+    """Import the LM Studio stack on first use; Claude sessions never load it."""
+    from .lmstudio import LMStudioAgent
+
+    return LMStudioAgent
+
+
 async def _run_lmstudio_chat() -> None:
     """Interactive chat loop using LM Studio direct backend."""
-    from .lmstudio import LMStudioAgent
+    agent_cls = _get_lmstudio_agent_cls()
+    session: PromptSession[str] = PromptSession("You: ")
 
-    async with LMStudioAgent() as agent:
+    async with agent_cls() as agent:
         while True:
             try:
-                user_input = input("You: ").strip()
+                user_input = (await session.prompt_async()).strip()
             except (EOFError, KeyboardInterrupt):
                 print("\nGoodbye!")
                 break
 
-            if user_input.lower() in ("quit", "exit", "q"):
-                print("Goodbye!")
-                break
-
             if not user_input:
                 continue
 
+            if user_input.lower() in _QUIT:
+                print("Goodbye!")
+                break
+
             print()
             response = await agent.query(user_input)
             if response.tool_calls_made:
@@ -101,7 +146,15 @@ async def run_interactive_chat() -> None:
 def main():
     """Entry point for interactive CLI."""
     try:
-        asyncio.run(run_interactive_chat())
+        # uvloop ships with uvicorn[standard] but has no Windows build.
+        import uvloop
+    except ImportError:
+        run = asyncio.run
+    else:
+        run = uvloop.run
+
+    try:
+        run(run_interactive_chat())
     except KeyboardInterrupt:
         print("\nGoodbye!")
 
@@ -1,11 +1,14 @@
 """Shared ClaudeAgentOptions builder for all entry points."""
 
+import functools
+
 from claude_agent_sdk import ClaudeAgentOptions
 
 from .config import config
 from .prompts import ALLOWED_TOOLS, MCP_SERVER_NAME, SYSTEM_PROMPT
 
 
+@functools.lru_cache(maxsize=8)
 def build_claude_options(**overrides) -> ClaudeAgentOptions:
     """Build ClaudeAgentOptions with backend-aware env/model injection.
 
@@ -13,7 +16,9 @@ def build_claude_options(**overrides) -> ClaudeAgentOptions:
     ANTHROPIC_AUTH_TOKEN into the subprocess env and sets the model.
 
     Extra keyword arguments (e.g. permission_mode) are forwarded to
-    ClaudeAgentOptions.
+    ClaudeAgentOptions; they must be hashable. Results are memoized per set
+    of overrides, so the returned options are shared and must not be
+    mutated.
     """
     env: dict[str, str] = {}
     model: str | None = None
@@ -32,7 +37,7 @@ def build_claude_options(**overrides) -> ClaudeAgentOptions:
                 "env": {"CONTROLLER_BIND_ADDR": config.controller_bind_addr},
             }
         },
-        allowed_tools=ALLOWED_TOOLS,
+        allowed_tools=list(ALLOWED_TOOLS),
         system_prompt=SYSTEM_PROMPT,
         model=model,
         env=env,
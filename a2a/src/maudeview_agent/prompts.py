@@ -65,7 +65,8 @@ Always use list_charts first to get valid chart IDs before operating on charts.
 Always use list_watchlists first to get valid watchlist IDs before operating on watchlists.
 """
 
-ALLOWED_TOOLS = [
+# Immutable: shared by every ClaudeAgentOptions and the LM Studio tool filter.
+ALLOWED_TOOLS = (
     # Watchlist tools
     "mcp__maudeview__list_watchlists",
     "mcp__maudeview__get_active_watchlist",
@@ -118,4 +119,6 @@ ALLOWED_TOOLS = [
     "mcp__maudeview__prev_chart",
     "mcp__maudeview__maximize_chart",
     "mcp__maudeview__activate_chart",
-]
+)
+
+ALLOWED_TOOLS_SET = frozenset(ALLOWED_TOOLS)